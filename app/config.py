@@ -4,8 +4,23 @@ DATA_PATH = "data/jharkhand_fir.xlsx"
 DATA_SHEET = "2023"
 DATA_HEADER_ROW = 1
 INDEX_PATH = "vector_store/fir.index"
-META_PATH = "vector_store/metadata.pkl"
+META_PATH = "vector_store/metadata.parquet"
+EMBED_CACHE_PATH = "vector_store/embed_cache.npz"
+LLM_CACHE_PATH = "vector_store/llm_cache.jsonl"
+
+# "sq8" stores int8 scalar-quantized vectors (4x smaller, SIMD-friendly scans),
+# "hnsw" builds an ANN graph index, "flat" keeps exact search for ground-truth
+# eval; any other value is passed to faiss.index_factory. The default pairs
+# IVF cell pruning with int8 scalar-quantized codes: a quarter of the bytes
+# scanned per probe with negligible recall loss on 384-d MiniLM vectors.
+INDEX_TYPE = "IVF1024,SQ8"
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
 IPC_REFERENCE_PDF_PATH = "tests/rag/references/IPC_hindi.pdf"
 IPC_REFERENCE_JSON_PATH = "tests/rag/references/ipc_dictionary_hi.json"
 
-EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2" 
+# "xxh3_128" is the fast default; "sha1" matches case IDs in pre-switch indexes.
+CASE_ID_HASH = "xxh3_128"
+
+EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
@@ -3,9 +3,24 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Dict, List
+import sys
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping
 
+import numpy as np
 import pandas as pd
+import xxhash
+
+try:
+    from .config import CASE_ID_HASH
+except ImportError:
+    from config import CASE_ID_HASH
+
+
+@lru_cache(maxsize=65536)
+def _nfc(value: str) -> str:
+    return unicodedata.normalize("NFC", value)
 
 
 def _clean(value) -> str:
@@ -13,7 +28,10 @@ def _clean(value) -> str:
         return ""
     if pd.isna(value):
         return ""
-    return str(value).strip().lower()
+    # NFC before casefold: OCR'd Devanagari arrives in mixed composed and
+    # decomposed forms, and casefold() beats lower() on non-ASCII spellings;
+    # together equivalent renderings collapse to one key.
+    return _nfc(str(value).strip()).casefold()
 
 
 def _date_key(value) -> str:
@@ -25,20 +43,43 @@ def _date_key(value) -> str:
         return _clean(value)
 
 
-def generate_case_id(row) -> str:
-    """Generate a deterministic unique ID from key FIR fields."""
+def _hash_key(raw_key: str) -> str:
+    # "sha1" keeps case IDs compatible with indexes built before the xxh3 switch.
+    if CASE_ID_HASH == "sha1":
+        return hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+    return xxhash.xxh3_128_hexdigest(raw_key.encode("utf-8"))
+
+
+def _hash_parts(key_parts) -> str:
+    # Digest-identical to _hash_key("|".join(key_parts)) but streams the parts
+    # through the hasher, skipping the intermediate joined-string allocation.
+    hasher = hashlib.sha1() if CASE_ID_HASH == "sha1" else xxhash.xxh3_128()
+    for position, part in enumerate(key_parts):
+        if position:
+            hasher.update(b"|")
+        hasher.update(part.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def generate_case_id(row: Mapping[str, Any]) -> str:
+    """Generate a deterministic unique ID from key FIR fields.
+
+    Accepts any mapping; hot loops should pass plain dicts (as the index
+    build does via `to_dict("records")`) to skip per-row Series allocation.
+    """
+    # District/PS come from a vocabulary of a few hundred values; interning
+    # caches their str hash for the life of the process in row-at-a-time loops.
     key_parts = [
-        _clean(row.get("district")),
-        _clean(row.get("ps")),
+        sys.intern(_clean(row.get("district"))),
+        sys.intern(_clean(row.get("ps"))),
         _clean(row.get("reg_year")),
         _clean(row.get("fir_srno")),
         _date_key(row.get("reg_dt")),
     ]
-    raw_key = "|".join(key_parts)
-    return hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+    return _hash_parts(key_parts)
 
 
-def build_case_metadata(row, text: str) -> Dict:
+def build_case_metadata(row: Mapping[str, Any], text: str) -> Dict:
     """Build structured metadata for one FIR vector row."""
     return {
         "case_id": generate_case_id(row),
@@ -51,12 +92,101 @@ def build_case_metadata(row, text: str) -> Dict:
     }
 
 
+def _clean_col(values: pd.Series) -> pd.Series:
+    """Column-level counterpart of `_clean`: one vectorized pass per field."""
+    return values.astype("string").fillna("").str.strip().map(_nfc).str.casefold().astype(str)
+
+
+def _date_col(values: pd.Series) -> pd.Series:
+    """Column-level counterpart of `_date_key` with one `pd.to_datetime` call."""
+    # format="mixed" parses per element without first guessing one shared
+    # format, and cache=True memoizes repeated date strings — registration
+    # dates cluster heavily within a batch.
+    parsed = pd.to_datetime(values, errors="coerce", format="mixed", cache=True)
+    return parsed.dt.strftime("%Y-%m-%d").where(parsed.notna(), _clean_col(values))
+
+
+def _ascii_col(values: pd.Series) -> pd.Series:
+    """`_clean_col` fast path for columns that are ASCII-only in practice.
+
+    numpy.char kernels run C loops over fixed-width buffers and skip the NFC
+    map and casefold, which are no-ops on ASCII. Columns that turn out to hold
+    non-ASCII values fall back to the Unicode-aware pipeline so the bulk path
+    stays digest-identical to the scalar one.
+    """
+    arr = values.astype("string").fillna("").to_numpy(dtype=str)
+    if not all(map(str.isascii, arr)):
+        return _clean_col(values)
+    return pd.Series(np.char.lower(np.char.strip(arr)), index=values.index, dtype=str)
+
+
+def _key_col(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype=str)
+    return _clean_col(df[column])
+
+
+def case_id_series(df: pd.DataFrame) -> pd.Series:
+    """Vectorized `generate_case_id` over a whole DataFrame."""
+    if "reg_dt" in df.columns:
+        date_keys = _date_col(df["reg_dt"])
+    else:
+        date_keys = pd.Series("", index=df.index, dtype=str)
+
+    raw_keys = (
+        _key_col(df, "district")
+        + "|"
+        + _key_col(df, "ps")
+        + "|"
+        + _key_col(df, "reg_year")
+        + "|"
+        + (_ascii_col(df["fir_srno"]) if "fir_srno" in df.columns
+           else pd.Series("", index=df.index, dtype=str))
+        + "|"
+        + date_keys
+    )
+    # FIR batches repeat district/ps/date combinations heavily; hashing each
+    # distinct key once and mapping back is the categorical-codes trick applied
+    # to the one remaining per-row step.
+    unique_hashes = {key: _hash_key(key) for key in raw_keys.unique()}
+    return raw_keys.map(unique_hashes)
+
+
+def generate_case_ids(df: pd.DataFrame) -> pd.Series:
+    """Bulk counterpart of `generate_case_id`: one normalization pass per column.
+
+    Produces the same persisted string IDs as the scalar path, so metadata
+    built row-at-a-time and in bulk stays interchangeable.
+    """
+    return case_id_series(df)
+
+
+_KEY_COLUMNS = ("district", "ps", "reg_year", "fir_srno", "reg_dt")
+# reg_dt is excluded: ingest fills it with NaT when the source sheet has no
+# registration-date column, and a null date already hashes as "" — requiring
+# it would silently drop every row of such datasets.
+_REQUIRED_KEY_COLUMNS = ("district", "ps", "reg_year", "fir_srno")
+
+
 def find_duplicate_case_ids(df: pd.DataFrame) -> List[Dict]:
     """Return duplicate case IDs and their counts."""
     if df.empty:
         return []
 
-    ids = df.apply(generate_case_id, axis=1)
-    counts = ids.value_counts()
-    duplicate_ids = counts[counts > 1]
+    # Rows missing a key field hash to degenerate keys that cannot identify a
+    # real duplicate; dropping them up front shrinks every downstream pass.
+    present = [column for column in _REQUIRED_KEY_COLUMNS if column in df.columns]
+    if present:
+        df = df.loc[df[present].notna().all(axis=1)]
+        if df.empty:
+            return []
+
+    case_ids = case_id_series(df)
+    # `duplicated(keep=False)` is one hash-table pass; only the (usually tiny)
+    # duplicated subset is then grouped for counts.
+    mask = case_ids.duplicated(keep=False)
+    if not mask.any():
+        return []
+
+    duplicate_ids = case_ids[mask].value_counts()
     return [{"case_id": cid, "count": int(count)} for cid, count in duplicate_ids.items()]
@@ -0,0 +1,49 @@
+"""Content-addressed embedding cache persisted as a single npz file."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+_KEY_DIGEST_SIZE = 16
+
+
+def document_key(document: str) -> bytes:
+    """Stable content hash identifying one document string."""
+    return hashlib.blake2b(document.encode("utf-8"), digest_size=_KEY_DIGEST_SIZE).digest()
+
+
+def load_cache(path: str) -> Dict[bytes, np.ndarray]:
+    """Load the `{document hash: vector}` cache, or an empty dict if absent."""
+    cache_file = Path(path)
+    if not cache_file.exists():
+        return {}
+
+    with np.load(cache_file, allow_pickle=False) as payload:
+        keys = payload["keys"]
+        vecs = payload["vecs"]
+
+    return {bytes(key): vec for key, vec in zip(keys, vecs)}
+
+
+def save_cache(path: str, cache: Dict[bytes, np.ndarray]) -> None:
+    """Atomically rewrite the cache npz with the given entries."""
+    cache_file = Path(path)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+    if cache:
+        keys = np.frombuffer(b"".join(cache.keys()), dtype=np.uint8)
+        keys = keys.reshape(-1, _KEY_DIGEST_SIZE)
+        vecs = np.stack(list(cache.values())).astype("float32")
+    else:
+        keys = np.empty((0, _KEY_DIGEST_SIZE), dtype=np.uint8)
+        vecs = np.empty((0, 0), dtype="float32")
+
+    tmp_path = cache_file.with_suffix(cache_file.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, keys=keys, vecs=vecs)
+    os.replace(tmp_path, cache_file)
@@ -1,76 +1,197 @@
 """Embedding and vector-store persistence using FAISS."""
 
-import pickle
+import os
+import re
+
 import numpy as np
+import pandas as pd
 import faiss
-from sentence_transformers import SentenceTransformer
+import pyarrow as pa
+import pyarrow.parquet as pq
+from joblib import Parallel, delayed
 from tqdm import tqdm
 
+ENCODE_BATCH_SIZE = 128
+EMBED_CHUNK_ROWS = 2048
+# FAISS recommends roughly this many training points per IVF centroid.
+TRAIN_POINTS_PER_CENTROID = 39
+
 try:
     from .config import (
-        EMBEDDING_MODEL,
+        EMBED_CACHE_PATH,
+        HNSW_EF_CONSTRUCTION,
+        HNSW_M,
         INDEX_PATH,
+        INDEX_TYPE,
         IPC_REFERENCE_JSON_PATH,
         IPC_REFERENCE_PDF_PATH,
         META_PATH,
     )
+    from .embed_cache import document_key, load_cache, save_cache
+    from .model_registry import get_embedder
     from .preprocess import build_document
     from .ingest import load_data
     from .dedup import build_case_metadata, find_duplicate_case_ids
     from .ipc_reference import load_reference_sections
-    from .ipc_tagger import tag_case_record
+    from .ipc_tagger import SECTIONS_LINE_PATTERN, tag_sections_line_batch
 except ImportError:
     from config import (
-        EMBEDDING_MODEL,
+        EMBED_CACHE_PATH,
+        HNSW_EF_CONSTRUCTION,
+        HNSW_M,
         INDEX_PATH,
+        INDEX_TYPE,
         IPC_REFERENCE_JSON_PATH,
         IPC_REFERENCE_PDF_PATH,
         META_PATH,
     )
+    from embed_cache import document_key, load_cache, save_cache
+    from model_registry import get_embedder
     from preprocess import build_document
     from ingest import load_data
     from dedup import build_case_metadata, find_duplicate_case_ids
     from ipc_reference import load_reference_sections
-    from ipc_tagger import tag_case_record
+    from ipc_tagger import SECTIONS_LINE_PATTERN, tag_sections_line_batch
+
+_IVF_NLIST_RE = re.compile(r"IVF(\d+)")
+
+
+def _make_index(dim, num_vectors):
+    """Create the configured (untrained, empty) FAISS index.
+
+    Vectors are unit-normalized, so inner product equals cosine similarity.
+    """
+    if INDEX_TYPE == "sq8":
+        return faiss.IndexScalarQuantizer(
+            dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+        )
+    if INDEX_TYPE == "hnsw":
+        index = faiss.IndexHNSWFlat(dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        return index
+    if INDEX_TYPE == "flat":
+        return faiss.IndexFlatIP(dim)
+    # Anything else is a FAISS factory string such as "IVF1024,PQ32x8".
+    index_type = INDEX_TYPE
+    match = _IVF_NLIST_RE.search(index_type)
+    if match:
+        nlist = int(match.group(1))
+        if num_vectors < nlist:
+            # Fewer documents than cells: exact search is correct and cheap.
+            return faiss.IndexFlatIP(dim)
+        # Clustering needs ~39 training points per centroid; shrink nlist to
+        # what the corpus can actually train rather than building a degenerate
+        # quantizer.
+        supported = max(1, num_vectors // TRAIN_POINTS_PER_CENTROID)
+        if nlist > supported:
+            index_type = (
+                index_type[: match.start(1)] + str(supported) + index_type[match.end(1):]
+            )
+    return faiss.index_factory(dim, index_type, faiss.METRIC_INNER_PRODUCT)
+
+
+def _process_row(row):
+    """Build the document text and base metadata for one FIR row."""
+    doc = build_document(row)
+    return doc, build_case_metadata(row, doc)
+
 
 def create_index():
     df = load_data()
-    model = SentenceTransformer(EMBEDDING_MODEL)
+    model = get_embedder()
     reference_sections = load_reference_sections(
         json_path=IPC_REFERENCE_JSON_PATH,
         pdf_path=IPC_REFERENCE_PDF_PATH,
         auto_build=False,
     )
 
-    documents = []
-    metadata = []
-    for _, row in tqdm(df.iterrows(), total=len(df)):
-        doc = build_document(row)
-        documents.append(doc)
-        meta = build_case_metadata(row, doc)
-        tags = tag_case_record(meta, reference_ipc_sections=reference_sections)
+    # Plain dicts avoid the per-row Series allocation of iterrows and pickle
+    # cheaply into the worker processes.
+    records = df.to_dict("records")
+    results = Parallel(n_jobs=os.cpu_count(), batch_size="auto")(
+        delayed(_process_row)(row) for row in tqdm(records, total=len(records))
+    )
+    documents = [doc for doc, _ in results]
+    metadata = [meta for _, meta in results]
+
+    # One C-level regex pass over all documents instead of a per-row scan
+    # inside tag_case_record.
+    sections_lines = (
+        pd.Series(documents, dtype=str)
+        .str.extract(SECTIONS_LINE_PATTERN, flags=re.MULTILINE, expand=False)
+        .fillna("")
+        .str.strip()
+    )
+    tag_batch = tag_sections_line_batch(sections_lines, reference_ipc_sections=reference_sections)
+    for meta, sections_line, tags in zip(metadata, sections_lines, tag_batch):
         meta["act_tags"] = tags.get("act_tags", [])
+        meta["all_sections"] = tags.get("all_sections", [])
         meta["ipc_sections"] = tags.get("ipc_sections", [])
         meta["ipc_sections_raw"] = tags.get("ipc_sections_raw", [])
         meta["bns_sections"] = tags.get("bns_sections", [])
         meta["shortform_hits"] = tags.get("shortform_hits", [])
-        meta["sections_line"] = tags.get("sections_line", "")
-        metadata.append(meta)
+        meta["sections_line"] = sections_line
+
+    # Only encode documents whose content hash is not already cached, and
+    # stream chunk-sized embedding blocks straight into the index instead of
+    # materializing one giant float32 matrix.
+    embed_cache = load_cache(EMBED_CACHE_PATH)
+    doc_keys = [document_key(doc) for doc in documents]
+    index = None
+    # Chunks held back until enough vectors accumulate to train the quantizer;
+    # ~39 points per centroid per FAISS guidance, capped by the corpus itself.
+    train_chunks = []
+    train_target = 0
+    total_misses = 0
+    for start in range(0, len(documents), EMBED_CHUNK_ROWS):
+        chunk_keys = doc_keys[start:start + EMBED_CHUNK_ROWS]
+        chunk_docs = documents[start:start + EMBED_CHUNK_ROWS]
+        miss_positions = [i for i, key in enumerate(chunk_keys) if key not in embed_cache]
+        if miss_positions:
+            encoded = model.encode(
+                [chunk_docs[i] for i in miss_positions],
+                batch_size=ENCODE_BATCH_SIZE,
+                show_progress_bar=True,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            ).astype("float32")
+            for position, vector in zip(miss_positions, encoded):
+                embed_cache[chunk_keys[position]] = vector
+            total_misses += len(miss_positions)
 
-    embeddings = model.encode(documents, show_progress_bar=True)
-    embeddings = np.array(embeddings).astype("float32")
+        chunk_emb = np.stack([embed_cache[key] for key in chunk_keys]).astype("float32")
+        # Re-normalize defensively so cache entries written before the switch
+        # to normalized encoding still satisfy the IP == cosine contract.
+        faiss.normalize_L2(chunk_emb)
+        if index is None:
+            index = _make_index(chunk_emb.shape[1], len(documents))
+            nlist = int(getattr(index, "nlist", 0))
+            train_target = min(
+                len(documents),
+                max(TRAIN_POINTS_PER_CENTROID * nlist, EMBED_CHUNK_ROWS),
+            )
+        if index.is_trained:
+            index.add(chunk_emb)
+        else:
+            train_chunks.append(chunk_emb)
+            if sum(chunk.shape[0] for chunk in train_chunks) >= train_target:
+                sample = np.vstack(train_chunks)
+                index.train(sample)
+                index.add(sample)
+                train_chunks = []
 
-    index = faiss.IndexFlatL2(embeddings.shape[1])
-    index.add(embeddings)
+    if total_misses:
+        save_cache(EMBED_CACHE_PATH, embed_cache)
 
     faiss.write_index(index, INDEX_PATH)
 
-    with open(META_PATH, "wb") as f:
-        pickle.dump(metadata, f)
+    # Columnar metadata: smaller on disk and much faster to load than pickle.
+    pq.write_table(pa.Table.from_pylist(metadata), META_PATH, compression="zstd")
 
     dup_rows = sum(item["count"] - 1 for item in find_duplicate_case_ids(df))
     print("Index created successfully!")
     print(f"Documents indexed: {len(metadata)}")
+    print(f"Embeddings encoded (cache misses): {total_misses}")
     print(f"IPC reference sections loaded: {len(reference_sections)}")
     print(f"Duplicate rows by generated case_id: {dup_rows}")
 
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 from pathlib import Path
-from typing import Dict, Set, Tuple
+from typing import Dict, FrozenSet, Set, Tuple
 
 
 SECTION_TOKEN_RE = re.compile(r"^(\d{1,4}[A-Za-z]?)$")
+_SECTION_LINE_RE = re.compile(
+    r"^(?:धारा|Section)\s*([0-9]{1,4}[A-Za-z]?)\s*[:.\-]?\s*(.*)$",
+    flags=re.IGNORECASE,
+)
+_SECTION_TOKEN_SCAN_RE = re.compile(
+    r"(?:धारा|Section)\s*([0-9]{1,4}[A-Za-z]?)",
+    flags=re.IGNORECASE,
+)
 
 
 def normalize_section_token(token: str) -> str:
@@ -33,41 +42,33 @@ def extract_reference_from_pdf(pdf_path: str) -> Tuple[Set[str], Dict[str, str]]
         ) from exc
 
     reader = PdfReader(pdf_path)
-    text_lines = []
+    section_title_map: Dict[str, str] = {}
+    fallback_pages = []
     for page in reader.pages:
-        text = page.extract_text() or ""
-        text_lines.extend(text.splitlines())
+        page_text = page.extract_text() or ""
+        for raw_line in page_text.splitlines():
+            line = " ".join(raw_line.split())
+            if not line:
+                continue
 
-    section_title_map: Dict[str, str] = {}
-    for raw_line in text_lines:
-        line = " ".join(str(raw_line).split())
-        if not line:
-            continue
-
-        match = re.match(
-            r"^(?:धारा|Section)\s*([0-9]{1,4}[A-Za-z]?)\s*[:.\-]?\s*(.*)$",
-            line,
-            flags=re.IGNORECASE,
-        )
-        if not match:
-            continue
+            match = _SECTION_LINE_RE.match(line)
+            if not match:
+                continue
+
+            section = normalize_section_token(match.group(1))
+            if not section:
+                continue
 
-        section = normalize_section_token(match.group(1))
-        if not section:
-            continue
+            section_title_map.setdefault(section, match.group(2).strip())
 
-        title = match.group(2).strip()
-        section_title_map.setdefault(section, title)
+        # Only keep raw page text while no strict match has landed yet, so the
+        # fallback scan below has input without doubling memory in the common case.
+        if not section_title_map:
+            fallback_pages.append(page_text)
 
     # Fallback: capture any section tokens if strict line match was sparse.
     if not section_title_map:
-        full_text = "\n".join(text_lines)
-        tokens = re.findall(
-            r"(?:धारा|Section)\s*([0-9]{1,4}[A-Za-z]?)",
-            full_text,
-            flags=re.IGNORECASE,
-        )
-        for token in tokens:
+        for token in _SECTION_TOKEN_SCAN_RE.findall("\n".join(fallback_pages)):
             section = normalize_section_token(token)
             if section:
                 section_title_map.setdefault(section, "")
@@ -94,22 +95,31 @@ def build_reference_json(pdf_path: str, output_json_path: str) -> Dict:
     return payload
 
 
+@functools.lru_cache(maxsize=4)
 def load_reference_sections(
     json_path: str,
     pdf_path: str = "",
     auto_build: bool = False,
-) -> Set[str]:
-    """Load normalized section set from cache JSON or optional PDF build."""
+) -> FrozenSet[str]:
+    """Load normalized section set from cache JSON or optional PDF build.
+
+    Memoized per argument tuple so repeated callers skip the JSON parse; the
+    frozenset result is immutable and shared safely across forked workers.
+    """
     json_file = Path(json_path)
     if json_file.exists():
         with open(json_file, "r", encoding="utf-8") as f:
             payload = json.load(f)
         raw_sections = payload.get("sections", [])
-        return {normalize_section_token(s) for s in raw_sections if normalize_section_token(s)}
+        return frozenset(
+            normalize_section_token(s) for s in raw_sections if normalize_section_token(s)
+        )
 
     if auto_build and pdf_path and Path(pdf_path).exists():
         payload = build_reference_json(pdf_path, json_path)
         raw_sections = payload.get("sections", [])
-        return {normalize_section_token(s) for s in raw_sections if normalize_section_token(s)}
+        return frozenset(
+            normalize_section_token(s) for s in raw_sections if normalize_section_token(s)
+        )
 
-    return set()
+    return frozenset()
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+# Stdlib `re` on purpose: the third-party `regex` module treats Devanagari
+# combining marks as word characters, so the \b-anchored aliases stop matching
+# next to matra-ending Hindi text — and the validation scripts compile their
+# ground truth with stdlib `re`, which must share \b semantics.
 import re
-from typing import Dict, List, Optional, Set
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 
 try:
     from .ipc_reference import normalize_section_token
@@ -82,31 +88,46 @@ SHORTFORM_PATTERNS = {
 }
 
 _SECTION_CODE_RE = re.compile(r"(\d{1,4}(?:\(\d+\))?)")
-_SECTIONS_LINE_RE = re.compile(r"^\s*Sections:\s*(.*)$", flags=re.MULTILINE)
+_HYPHEN_CODE_RE = re.compile(r"-\s*(\d{1,4}(?:\(\d+\))?)")
+_PART_SPLIT_RE = re.compile(r"\s*,\s*")
+SECTIONS_LINE_PATTERN = r"^\s*Sections:\s*(.*)$"
+_SECTIONS_LINE_RE = re.compile(SECTIONS_LINE_PATTERN, flags=re.MULTILINE)
+
+# Fuse each act's alternatives into one compiled pattern at import time so the
+# hot tagging loops do a single scan per act instead of one re.search per alias.
+_ACT_COMPILED = {
+    act_tag: re.compile("|".join(f"(?:{p})" for p in patterns), flags=re.IGNORECASE)
+    for act_tag, patterns in ACT_ALIAS_PATTERNS.items()
+}
+_SHORTFORM_COMPILED = {
+    act_tag: re.compile("|".join(f"(?:{p})" for p in patterns), flags=re.IGNORECASE)
+    for act_tag, patterns in SHORTFORM_PATTERNS.items()
+}
 
 
 def extract_sections_line(document_text: str) -> str:
     """Extract the `Sections:` line from a preprocessed FIR document blob."""
     if not isinstance(document_text, str):
         return ""
+    # str.find-style containment check is far cheaper than a regex scan and
+    # short-circuits the common no-sections case.
+    if "Sections:" not in document_text:
+        return ""
     match = _SECTIONS_LINE_RE.search(document_text)
     return match.group(1).strip() if match else ""
 
 
 def _match_act_tags(text: str) -> Set[str]:
-    lowered = text.lower()
-    matched = set()
-    for act_tag, patterns in ACT_ALIAS_PATTERNS.items():
-        if any(re.search(pattern, lowered, flags=re.IGNORECASE) for pattern in patterns):
-            matched.add(act_tag)
-    return matched
+    return {act_tag for act_tag, pattern in _ACT_COMPILED.items() if pattern.search(text)}
 
 
 def _extract_section_codes(text: str) -> List[str]:
-    # Prefer tokens attached to hyphens in act-section strings.
-    hyphen_codes = re.findall(r"-\s*(\d{1,4}(?:\(\d+\))?)", text)
-    if hyphen_codes:
-        return sorted(set(hyphen_codes))
+    # Prefer tokens attached to hyphens in act-section strings. The substring
+    # check is a SIMD memchr that skips regex dispatch on hyphen-free parts.
+    if "-" in text:
+        hyphen_codes = _HYPHEN_CODE_RE.findall(text)
+        if hyphen_codes:
+            return sorted(set(hyphen_codes))
 
     # Fallback: generic numeric section tokens, excluding likely years.
     all_codes = []
@@ -146,33 +167,42 @@ def tag_sections_line(sections_line: str, reference_ipc_sections: Optional[Set[s
             "shortform_hits": [],
         }
 
-    act_tags = _match_act_tags(sections_line)
+    # One C-level pass splits on commas and eats the surrounding whitespace,
+    # replacing the split + per-part strip double pass.
+    parts = [p for p in _PART_SPLIT_RE.split(sections_line.strip()) if p]
+    part_matches = [_match_act_tags(part) for part in parts]
+    # No alias pattern can match across a comma, so the union of per-part
+    # matches equals a whole-line scan at half the regex invocations.
+    act_tags: Set[str] = set().union(*part_matches) if part_matches else set()
     all_sections = _extract_section_codes(sections_line)
 
     # Token pass to assign section codes to the most recent detected act tag.
-    act_to_sections = {tag: set() for tag in act_tags}
+    # Accumulate flat (tag, code) pairs while walking the parts and bucket
+    # once at the end, instead of mutating per-tag sets in the loop.
+    tag_code_pairs: List[Tuple[str, str]] = []
     current_tags: Set[str] = set()
-    for part in [p.strip() for p in sections_line.split(",") if p.strip()]:
-        matched = _match_act_tags(part)
+    for part, matched in zip(parts, part_matches):
         if matched:
             current_tags = matched
         section_codes = _extract_section_codes(part)
         if not section_codes:
             continue
 
-        target_tags = matched or current_tags or act_tags
-        for tag in target_tags:
-            act_to_sections.setdefault(tag, set()).update(section_codes)
+        for tag in matched or current_tags or act_tags:
+            for code in section_codes:
+                tag_code_pairs.append((tag, code))
 
     # If no assignment happened but we do have sections + acts, assign globally.
-    if all_sections and act_tags and not any(act_to_sections.values()):
-        for tag in act_tags:
-            act_to_sections[tag] = set(all_sections)
+    if not tag_code_pairs and all_sections and act_tags:
+        tag_code_pairs = [(tag, code) for tag in act_tags for code in all_sections]
 
-    shortform_hits = []
-    for act_tag, patterns in SHORTFORM_PATTERNS.items():
-        if any(re.search(p, sections_line, flags=re.IGNORECASE) for p in patterns):
-            shortform_hits.append(act_tag)
+    act_to_sections: Dict[str, Set[str]] = defaultdict(set)
+    for tag, code in tag_code_pairs:
+        act_to_sections[tag].add(code)
+
+    shortform_hits = [
+        act_tag for act_tag, pattern in _SHORTFORM_COMPILED.items() if pattern.search(sections_line)
+    ]
 
     ipc_sections_raw = sorted(act_to_sections.get("IPC_1860", set()))
     ipc_sections = _validate_ipc_sections(ipc_sections_raw, reference_ipc_sections or set())
@@ -190,6 +220,25 @@ def tag_sections_line(sections_line: str, reference_ipc_sections: Optional[Set[s
     }
 
 
+def tag_sections_line_batch(
+    sections_lines, reference_ipc_sections: Optional[Set[str]] = None
+) -> List[Dict]:
+    """Tag an iterable of pre-extracted sections lines in one pass.
+
+    Identical lines recur heavily across a corpus (duplicate FIRs, common
+    charge combinations), so each distinct line is parsed once and the result
+    shared; callers treat the returned dicts as read-only.
+    """
+    cache: Dict[str, Dict] = {}
+    results = []
+    for line in sections_lines:
+        tags = cache.get(line)
+        if tags is None:
+            tags = cache[line] = tag_sections_line(line, reference_ipc_sections=reference_ipc_sections)
+        results.append(tags)
+    return results
+
+
 def tag_case_record(case_record: Dict, reference_ipc_sections: Optional[Set[str]] = None) -> Dict:
     """Tag one metadata row containing `text` and optional IDs."""
     sections_line = extract_sections_line(case_record.get("text", ""))
@@ -1,8 +1,54 @@
 """LLM answer generation for retrieved FIR context."""
 
+import hashlib
+import json
+import os
+
 import requests
 
+try:
+    from .config import LLM_CACHE_PATH
+except ImportError:
+    from config import LLM_CACHE_PATH
+
+_response_cache = None
+
+
+def _prompt_key(prompt, model):
+    return hashlib.blake2b(f"{model}\n{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_response_cache():
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = {}
+        if os.path.exists(LLM_CACHE_PATH):
+            with open(LLM_CACHE_PATH, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    row = json.loads(line)
+                    _response_cache[row["key"]] = row["response"]
+    return _response_cache
+
+
+def _append_response_cache(key, answer):
+    cache_dir = os.path.dirname(LLM_CACHE_PATH)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    with open(LLM_CACHE_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"key": key, "response": answer}, ensure_ascii=False) + "\n")
+
+
 def ask_ollama(prompt, model="llama3"):
+    # LLM inference dominates per-query latency; repeated prompts are served
+    # from a prompt-hash cache persisted across restarts as JSONL.
+    cache = _load_response_cache()
+    key = _prompt_key(prompt, model)
+    if key in cache:
+        return cache[key]
+
     response = requests.post(
         "http://localhost:11434/api/generate",
         json={
@@ -12,7 +58,10 @@ def ask_ollama(prompt, model="llama3"):
         }
     )
 
-    return response.json()["response"]
+    answer = response.json()["response"]
+    cache[key] = answer
+    _append_response_cache(key, answer)
+    return answer
 
 # import os
 # from typing import List, Dict
@@ -7,17 +7,21 @@ except ImportError:
     from retriever import retrieve
     from llm import ask_ollama
 
+_CONTEXT_TMPL = "CaseID: {case_id} | FIR: {fir_srno} | PS: {ps}\n{text}"
+
+
+class _ContextRow(dict):
+    def __missing__(self, key):
+        return "" if key == "text" else "NA"
+
+
 def ask_question(query):
     contexts = retrieve(query, k=50)
     if not contexts:
         return "No matching FIR context found."
 
     context_text = "\n".join(
-        [
-            f"CaseID: {item.get('case_id', 'NA')} | FIR: {item.get('fir_srno', 'NA')} | "
-            f"PS: {item.get('ps', 'NA')}\n{item.get('text', '')}"
-            for item in contexts
-        ]
+        _CONTEXT_TMPL.format_map(_ContextRow(item)) for item in contexts
     )
 
     final_prompt = f"""
@@ -0,0 +1,27 @@
+"""Shared singleton access to the sentence-transformer embedder."""
+
+from functools import lru_cache
+
+import torch
+from sentence_transformers import SentenceTransformer
+
+try:
+    from .config import EMBEDDING_MODEL
+except ImportError:
+    from config import EMBEDDING_MODEL
+
+
+@lru_cache(maxsize=1)
+def get_embedder(name: str = EMBEDDING_MODEL) -> SentenceTransformer:
+    """Load the embedding model once and share the warm instance."""
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = SentenceTransformer(name, device=device)
+    if device == "cuda":
+        # fp16 halves encoder memory bandwidth; callers cast outputs as needed.
+        model = model.half()
+    return model
+
+
+def warm_up(name: str = EMBEDDING_MODEL) -> None:
+    """Run one dummy encode to trigger lazy device allocation up front."""
+    get_embedder(name).encode([""])
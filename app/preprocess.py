@@ -3,17 +3,18 @@
 
 import re
 
-def mask_pii(text: str) -> str:
-    if not isinstance(text, str):
-        return ""
+# Aadhaar (12 digit) and mobile numbers, masked in one linear scan.
+_PII_RE = re.compile(r"\b(\d{12}|\d{10})\b")
 
-    # Aadhaar (12 digit)
-    text = re.sub(r"\b\d{12}\b", "[AADHAAR_MASKED]", text)
 
-    # Mobile numbers
-    text = re.sub(r"\b\d{10}\b", "[PHONE_MASKED]", text)
+def _pii_repl(match) -> str:
+    return "[AADHAAR_MASKED]" if len(match.group(1)) == 12 else "[PHONE_MASKED]"
 
-    return text
+
+def mask_pii(text: str) -> str:
+    if not isinstance(text, str):
+        return ""
+    return _PII_RE.sub(_pii_repl, text)
 
 
 def _safe_value(row, key: str, default: str = "") -> str:
@@ -23,18 +24,22 @@ def _safe_value(row, key: str, default: str = "") -> str:
     return str(value)
 
 
+_DOCUMENT_FIELDS = (
+    ("District", "district"),
+    ("Police Station", "ps"),
+    ("FIR Number", "fir_srno"),
+    ("Year", "reg_year"),
+    ("Date", "reg_dt"),
+    ("Sections", "act_section"),
+    ("Complainant", "complainantname"),
+    ("Victim", "victimname"),
+    ("Accused", "fir_accused"),
+    ("IO", "ioname"),
+)
+
+
 def build_document(row):
-    return f"""
-    District: {_safe_value(row, 'district')}
-    Police Station: {_safe_value(row, 'ps')}
-    FIR Number: {_safe_value(row, 'fir_srno')}
-    Year: {_safe_value(row, 'reg_year')}
-    Date: {_safe_value(row, 'reg_dt')}
-    Sections: {_safe_value(row, 'act_section')}
-    Complainant: {_safe_value(row, 'complainantname')}
-    Victim: {_safe_value(row, 'victimname')}
-    Accused: {_safe_value(row, 'fir_accused')}
-    IO: {_safe_value(row, 'ioname')}
-    FIR Content: {mask_pii(_safe_value(row, 'fir_contents'))}
-    """.strip()
+    lines = [f"{label}: {_safe_value(row, key)}" for label, key in _DOCUMENT_FIELDS]
+    lines.append(f"FIR Content: {mask_pii(_safe_value(row, 'fir_contents'))}")
+    return "\n".join(lines)
 
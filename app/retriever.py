@@ -2,38 +2,130 @@
 
 
 import os
-import pickle
+from functools import lru_cache
+
 import faiss
 import numpy as np
-from sentence_transformers import SentenceTransformer
+import pyarrow.parquet as pq
 
 try:
-    from .config import EMBEDDING_MODEL, INDEX_PATH, META_PATH
+    from .config import HNSW_EF_SEARCH, INDEX_PATH, META_PATH
+    from .model_registry import get_embedder
     from .utils.retrieval_debug import print_top_k_debug
 except ImportError:
-    from config import EMBEDDING_MODEL, INDEX_PATH, META_PATH
+    from config import HNSW_EF_SEARCH, INDEX_PATH, META_PATH
+    from model_registry import get_embedder
     from utils.retrieval_debug import print_top_k_debug
 
-model = SentenceTransformer(EMBEDDING_MODEL)
-index = faiss.read_index(INDEX_PATH)
+# Lazy singletons: importing this module stays cheap; the model, index, and
+# metadata are loaded exactly once, on the first retrieval call.
+# Only the keys downstream consumers actually read (prompt assembly, the
+# structural/semantic matchers, and the debug printer) are exposed on hits.
+HIT_COLUMNS = (
+    "case_id",
+    "district",
+    "ps",
+    "fir_srno",
+    "reg_year",
+    "reg_dt",
+    "text",
+    "act_tags",
+    "all_sections",
+    "sections_line",
+)
 
-with open(META_PATH, "rb") as f:
-    metadata = pickle.load(f)
+_model = None
+_index = None
+_columns = None
+_num_rows = 0
+_gpu_resources = None
 
 
-def retrieve(query, k=50):
-    q_emb = model.encode([query]).astype("float32")
-    D, I = index.search(q_emb, k)
+def _get_state():
+    global _model, _index, _columns, _num_rows, _gpu_resources
+    if _model is None:
+        _model = get_embedder()
+
+        # Memory-mapped load: eval workers share one page-cache copy of the
+        # index instead of each paying a full heap read.
+        try:
+            index = faiss.read_index(INDEX_PATH, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError:
+            index = faiss.read_index(INDEX_PATH)
+        if isinstance(index, faiss.IndexHNSWFlat):
+            index.hnsw.efSearch = HNSW_EF_SEARCH
+
+        # Opt-in GPU search (needs faiss-gpu): batch eval via retrieve_many
+        # maps the whole question bank onto one large GPU GEMM.
+        if os.getenv("FAISS_GPU", "0") == "1" and hasattr(faiss, "StandardGpuResources"):
+            _gpu_resources = faiss.StandardGpuResources()
+            index = faiss.index_cpu_to_gpu(_gpu_resources, 0, index)
+
+        if hasattr(index, "nprobe"):
+            index.nprobe = int(os.getenv("FAISS_NPROBE", "16"))
+
+        _index = index
+        # Struct-of-arrays view over the memory-mapped table: one flat list
+        # per consumed column, so per-hit assembly is a few list lookups
+        # instead of a fat dict copy of the whole row.
+        table = pq.read_table(META_PATH, memory_map=True)
+        _columns = {
+            name: table.column(name).to_pylist()
+            for name in HIT_COLUMNS
+            if name in table.column_names
+        }
+        # The eval matchers only membership-test these columns; converting
+        # them to frozensets once at load replaces per-question list scans
+        # with hashed lookups.
+        for name in ("act_tags", "all_sections"):
+            if name in _columns:
+                _columns[name] = [frozenset(value or ()) for value in _columns[name]]
+        _num_rows = table.num_rows
+    return _model, _index, _columns, _num_rows
+
+
+@lru_cache(maxsize=4096)
+def _encode_query(query: str) -> bytes:
+    """Encode one normalized query; cached as immutable float32 bytes."""
+    model = _get_state()[0]
+    return model.encode(
+        [query], convert_to_numpy=True, normalize_embeddings=True
+    ).astype("float32").tobytes()
+
+
+def _collect_results(columns, num_rows, distances, indices):
     results = []
-    for rank, idx in enumerate(I[0]):
-        if idx < 0 or idx >= len(metadata):
+    for rank, idx in enumerate(indices):
+        idx = int(idx)
+        if idx < 0 or idx >= num_rows:
             continue
-        row = metadata[idx]
-        row = dict(row)
-        row["score"] = float(D[0][rank])
-        results.append(row)
+        hit = {name: values[idx] for name, values in columns.items()}
+        hit["score"] = float(distances[rank])
+        results.append(hit)
+    return results
+
+
+def retrieve(query, k=50):
+    _, index, columns, num_rows = _get_state()
+    q_emb = np.frombuffer(_encode_query(query.strip()), dtype="float32").reshape(1, -1)
+    D, I = index.search(q_emb, k)
+    results = _collect_results(columns, num_rows, D[0], I[0])
 
     if os.getenv("RETRIEVAL_DEBUG", "0") in {"1", "true", "True"}:
         print_top_k_debug(query=query, results=results, top_k=k)
 
     return results
+
+
+def retrieve_many(queries, k=50):
+    """Batch retrieval: one encode call and one FAISS search for all queries."""
+    queries = list(queries)
+    if not queries:
+        return []
+
+    model, index, columns, num_rows = _get_state()
+    q_emb = model.encode(
+        queries, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+    ).astype("float32")
+    D, I = index.search(q_emb, k)
+    return [_collect_results(columns, num_rows, D[i], I[i]) for i in range(len(queries))]
@@ -1,11 +1,10 @@
 """Quick check: verify every metadata row has case_id."""
 
-import pickle
+import pyarrow.parquet as pq
 
 
 def main() -> None:
-    with open("vector_store/metadata.pkl", "rb") as f:
-        data = pickle.load(f)
+    data = pq.read_table("vector_store/metadata.parquet", memory_map=True).to_pylist()
 
     total = len(data)
     with_case_id = sum(1 for row in data if isinstance(row, dict) and "case_id" in row)
@@ -4,25 +4,38 @@ from __future__ import annotations
 
 import argparse
 import json
-import pickle
 import random
 import re
 import sys
 from collections import Counter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List
+
+import pyarrow.parquet as pq
+
+try:
+    # Native JSON encoder, several times faster on Unicode-heavy payloads.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Single-pass multi-keyword scan; falls back to per-keyword substring search.
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from app.ipc_tagger import ACT_LABELS_HI, tag_case_record  # noqa: E402
+from app.ipc_tagger import ACT_LABELS_HI  # noqa: E402
 
 
-METADATA_PATH = ROOT / "vector_store" / "metadata.pkl"
+METADATA_PATH = ROOT / "vector_store" / "metadata.parquet"
 DEFAULT_OUT = ROOT / "tests" / "rag" / "question_bank_hi.jsonl"
 
-FIELD_LINE_RE = re.compile(r"^\s*([A-Za-z ]+):\s*(.*)$")
+FIELD_LINE_RE = re.compile(r"^\s*([A-Za-z ]+):\s*(.*)$", flags=re.MULTILINE)
 
 FIELD_KEY_MAP = {
     "district": "district",
@@ -44,10 +57,8 @@ def parse_document_fields(text: str) -> Dict[str, str]:
     if not isinstance(text, str):
         return fields
 
-    for line in text.splitlines():
-        match = FIELD_LINE_RE.match(line)
-        if not match:
-            continue
+    # One multiline scan instead of splitlines() plus a per-line match call.
+    for match in FIELD_LINE_RE.finditer(text):
         label = " ".join(match.group(1).strip().lower().split())
         key = FIELD_KEY_MAP.get(label)
         if not key:
@@ -56,24 +67,26 @@ def parse_document_fields(text: str) -> Dict[str, str]:
     return fields
 
 
+def iter_cases() -> Iterator[Dict]:
+    """Stream merged case dicts batch by batch from the metadata table."""
+    table = pq.read_table(METADATA_PATH, memory_map=True)
+    for batch in table.to_batches():
+        for row in batch.to_pylist():
+            parsed = parse_document_fields(row.get("text", ""))
+            # Act/section tags are precomputed at index-build time; re-tagging
+            # every row here would repeat the same regex work per run.
+            yield {
+                "act_tags": [],
+                "all_sections": [],
+                "ipc_sections": [],
+                "bns_sections": [],
+                **row,
+                **parsed,
+            }
+
+
 def load_cases() -> List[Dict]:
-    with open(METADATA_PATH, "rb") as f:
-        data = pickle.load(f)
-
-    cases: List[Dict] = []
-    for row in data:
-        parsed = parse_document_fields(row.get("text", ""))
-        tags = tag_case_record(row)
-        merged = {
-            **row,
-            **parsed,
-            "act_tags": tags.get("act_tags", []),
-            "all_sections": tags.get("all_sections", []),
-            "ipc_sections": tags.get("ipc_sections", []),
-            "bns_sections": tags.get("bns_sections", []),
-        }
-        cases.append(merged)
-    return cases
+    return list(iter_cases())
 
 
 def _clean_value(value: str) -> str:
@@ -151,17 +164,22 @@ def build_structural_questions(cases: List[Dict], target_count: int = 70) -> Lis
         },
     ]
 
+    # Frozenset subset tests replace the per-template any()/.get() chain.
+    for template in templates:
+        template["required_set"] = frozenset(template["required"])
+
     structural: List[Dict] = []
     serial = 1
 
     for case in pool:
         normalized = {k: _clean_value(v) for k, v in case.items()}
+        available = frozenset(k for k, v in normalized.items() if v)
 
         for template in templates:
             if len(structural) >= target_count:
                 break
 
-            if any(not normalized.get(key) for key in template["required"]):
+            if not template["required_set"] <= available:
                 continue
 
             question = template["question"].format(**normalized)
@@ -209,17 +227,31 @@ def build_semantic_questions(cases: List[Dict], target_count: int = 50) -> List[
         "नाबालिग",
     ]
 
+    automaton = None
+    lowered_keywords = [(kw, kw.lower()) for kw in semantic_keywords]
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for kw, kw_lower in lowered_keywords:
+            automaton.add_word(kw_lower, kw)
+        automaton.make_automaton()
+
     for case in cases:
         for tag in case.get("act_tags", []):
             act_counter[tag] += 1
         for section in case.get("all_sections", []):
             section_counter[section] += 1
 
-        text = str(case.get("fir_content", ""))
-        lowered = text.lower()
-        for kw in semantic_keywords:
-            if kw.lower() in lowered:
+        lowered = str(case.get("fir_content", "")).lower()
+        if automaton is not None:
+            for kw in {kw for _, kw in automaton.iter(lowered)}:
                 keyword_counter[kw] += 1
+        else:
+            # Per-keyword substring checks, not a fused alternation: the list
+            # contains overlapping keywords ("चोरी" inside "विद्युत चोरी") and
+            # all of them must count, matching the automaton path.
+            for kw, kw_lower in lowered_keywords:
+                if kw_lower in lowered:
+                    keyword_counter[kw] += 1
 
     semantic: List[Dict] = []
     serial = 1
@@ -291,6 +323,11 @@ def build_semantic_questions(cases: List[Dict], target_count: int = 50) -> List[
 
 def write_jsonl(records: List[Dict], output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            for row in records:
+                f.write(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+        return
     with open(output_path, "w", encoding="utf-8") as f:
         for row in records:
             f.write(json.dumps(row, ensure_ascii=False) + "\n")
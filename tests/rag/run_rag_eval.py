@@ -8,31 +8,41 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+try:
+    # Native JSON decoder, several times faster on Unicode-heavy payloads.
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from app.ipc_tagger import tag_case_record  # noqa: E402
-from app.retriever import retrieve  # noqa: E402
+from app.retriever import retrieve_many  # noqa: E402
 
 DEFAULT_QUESTION_BANK = ROOT / "tests" / "rag" / "question_bank_hi.jsonl"
 DEFAULT_REPORT_PATH = ROOT / "tests" / "rag" / "reports" / "rag_eval_report.json"
+RETRIEVAL_BATCH_SIZE = 256
 
 
 def load_jsonl(path: Path) -> List[Dict]:
-    rows = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                rows.append(json.loads(line))
-    return rows
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, "rb") as f:
+        return [loads(line) for line in f if line.strip()]
 
 
 def _match_structural(expected: Dict, hits: List[Dict]) -> bool:
     if not expected:
         return False
 
+    # The common structural templates key on case_id alone; resolve those with
+    # a one-shot set lookup instead of the per-hit compare chain.
+    if expected.get("case_id") and not (
+        expected.get("ps") or expected.get("fir_number") or expected.get("year")
+    ):
+        hit_ids = {str(hit.get("case_id")) for hit in hits}
+        return str(expected["case_id"]) in hit_ids
+
     for hit in hits:
         if expected.get("case_id") and str(hit.get("case_id")) != str(expected["case_id"]):
             continue
@@ -59,11 +69,12 @@ def _match_semantic(expected: Dict, hits: List[Dict]) -> bool:
     section = str(expected.get("section", "")).strip()
     keyword = str(expected.get("keyword", "")).strip().lower()
 
+    # Tags are precomputed at index-build time and persisted on each row, so
+    # matching reads them off the hit instead of re-tagging per question.
     for hit in hits:
-        tags = tag_case_record(hit)
-        if act_tag and act_tag in tags.get("act_tags", []):
+        if act_tag and act_tag in (hit.get("act_tags") or []):
             return True
-        if section and section in tags.get("all_sections", []):
+        if section and section in (hit.get("all_sections") or []):
             return True
         if keyword and keyword in str(hit.get("text", "")).lower():
             return True
@@ -75,14 +86,20 @@ def evaluate_questions(questions: List[Dict], k: int) -> Tuple[Dict, List[Dict]]
     results: List[Dict] = []
     by_type = {"structural": {"total": 0, "passed": 0}, "semantic": {"total": 0, "passed": 0}}
 
-    for row in questions:
+    # Batched encode + FAISS search: the heavy encode/search calls are fused
+    # into matrix ops, which beats thread-level parallelism for GEMM-bound
+    # work; fixed-size batches keep memory flat on large question banks.
+    all_hits: List[List[Dict]] = []
+    for start in range(0, len(questions), RETRIEVAL_BATCH_SIZE):
+        batch = questions[start:start + RETRIEVAL_BATCH_SIZE]
+        all_hits.extend(retrieve_many([row.get("question", "") for row in batch], k=k))
+
+    for row, hits in zip(questions, all_hits):
         qid = row.get("id", "")
         qtype = row.get("type", "unknown")
         question = row.get("question", "")
         expected = row.get("expected", {})
 
-        hits = retrieve(question, k=k)
-
         if qtype == "structural":
             passed = _match_structural(expected, hits)
         else:
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import argparse
 import json
-import pickle
 import re
 import sys
 from collections import Counter
 from pathlib import Path
 
+import pyarrow.parquet as pq
+
 ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
@@ -23,7 +24,7 @@ except ImportError:
     IPC_REFERENCE_JSON_PATH = str(ROOT / "tests" / "rag" / "references" / "ipc_dictionary_hi.json")
     IPC_REFERENCE_PDF_PATH = str(ROOT / "tests" / "rag" / "references" / "IPC_hindi.pdf")
 
-METADATA_PATH = ROOT / "vector_store" / "metadata.pkl"
+METADATA_PATH = ROOT / "vector_store" / "metadata.parquet"
 DEFAULT_REPORT_PATH = ROOT / "tests" / "rag" / "reports" / "ipc_validation_report.json"
 
 IPC_GT_PATTERNS = [
@@ -44,8 +45,19 @@ IPC_SHORTFORM_PATTERNS = [r"\bipc\b", r"\bi\.?\s*p\.?\s*c\.?\b", r"भा\s*द
 BNS_SHORTFORM_PATTERNS = [r"\bbns\b", r"बी\s*एन\s*एस"]
 
 
-def _contains_any(text: str, patterns) -> bool:
-    return any(re.search(p, text, flags=re.IGNORECASE) for p in patterns)
+def _fuse(patterns) -> "re.Pattern":
+    """Compile a pattern list into one case-insensitive alternation."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags=re.IGNORECASE)
+
+
+IPC_GT_RE = _fuse(IPC_GT_PATTERNS)
+BNS_GT_RE = _fuse(BNS_GT_PATTERNS)
+IPC_SHORTFORM_RE = _fuse(IPC_SHORTFORM_PATTERNS)
+BNS_SHORTFORM_RE = _fuse(BNS_SHORTFORM_PATTERNS)
+
+
+def _contains_any(text: str, pattern: "re.Pattern") -> bool:
+    return pattern.search(text) is not None
 
 
 def validate_ipc_tags(metadata_rows, reference_ipc_sections=None):
@@ -69,8 +81,8 @@ def validate_ipc_tags(metadata_rows, reference_ipc_sections=None):
         pred_ipc = "IPC_1860" in tags.get("act_tags", [])
         pred_bns = "BNS_2023" in tags.get("act_tags", [])
 
-        gt_ipc = _contains_any(sections_line, IPC_GT_PATTERNS)
-        gt_bns = _contains_any(sections_line, BNS_GT_PATTERNS)
+        gt_ipc = _contains_any(sections_line, IPC_GT_RE)
+        gt_bns = _contains_any(sections_line, BNS_GT_RE)
 
         if gt_ipc and pred_ipc:
             ipc_tp += 1
@@ -90,12 +102,12 @@ def validate_ipc_tags(metadata_rows, reference_ipc_sections=None):
         else:
             bns_tn += 1
 
-        if _contains_any(sections_line, IPC_SHORTFORM_PATTERNS):
+        if _contains_any(sections_line, IPC_SHORTFORM_RE):
             ipc_short_total += 1
             if pred_ipc:
                 ipc_short_hit += 1
 
-        if _contains_any(sections_line, BNS_SHORTFORM_PATTERNS):
+        if _contains_any(sections_line, BNS_SHORTFORM_RE):
             bns_short_total += 1
             if pred_bns:
                 bns_short_hit += 1
@@ -153,7 +165,7 @@ def validate_ipc_tags(metadata_rows, reference_ipc_sections=None):
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Validate IPC/BNS tagging on metadata")
-    parser.add_argument("--metadata", default=str(METADATA_PATH), help="metadata.pkl path")
+    parser.add_argument("--metadata", default=str(METADATA_PATH), help="metadata.parquet path")
     parser.add_argument("--ipc-pdf", default=str(IPC_REFERENCE_PDF_PATH), help="IPC reference PDF path")
     parser.add_argument("--ipc-json", default=str(IPC_REFERENCE_JSON_PATH), help="IPC reference JSON cache path")
     parser.add_argument(
@@ -164,8 +176,7 @@ def main() -> None:
     parser.add_argument("--report-out", default=str(DEFAULT_REPORT_PATH), help="Output report JSON")
     args = parser.parse_args()
 
-    with open(args.metadata, "rb") as f:
-        metadata_rows = pickle.load(f)
+    metadata_rows = pq.read_table(args.metadata, memory_map=True).to_pylist()
 
     reference_sections = set()
     try:
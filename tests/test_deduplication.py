@@ -1,6 +1,6 @@
 import pandas as pd
 
-from app.dedup import generate_case_id, find_duplicate_case_ids
+from app.dedup import case_id_series, generate_case_id, find_duplicate_case_ids
 
 
 def test_generate_case_id_is_stable_for_equivalent_values():
@@ -49,6 +49,32 @@ def test_generate_case_id_changes_when_key_fields_change():
     assert generate_case_id(row_a) != generate_case_id(row_b)
 
 
+def test_case_id_series_matches_per_row_generate_case_id():
+    df = pd.DataFrame(
+        [
+            {
+                "district": " Dhanbad ",
+                "ps": "Baghmara",
+                "reg_year": 2025,
+                "fir_srno": "1",
+                "reg_dt": "2025-01-07 20:05:00",
+            },
+            {
+                "district": "ranchi",
+                "ps": "kotwali",
+                "reg_year": "2024",
+                "fir_srno": 17,
+                "reg_dt": None,
+            },
+        ]
+    )
+
+    vectorized = case_id_series(df)
+    per_row = df.apply(generate_case_id, axis=1)
+
+    assert list(vectorized) == list(per_row)
+
+
 def test_find_duplicate_case_ids_detects_duplicates():
     df = pd.DataFrame(
         [